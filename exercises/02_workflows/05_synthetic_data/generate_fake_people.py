@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 import argparse
-import csv
+import collections
 import math
 import os
-import random
 import sys
-from typing import Iterator, Dict, List, Optional
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from queue import Queue
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 try:
     from faker import Faker
@@ -13,6 +15,12 @@ except ImportError:
     print("Missing dependency: faker. Install with: pip install faker", file=sys.stderr)
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    print("Missing dependency: numpy. Install with: pip install numpy", file=sys.stderr)
+    sys.exit(1)
+
 # Optional Parquet support (pyarrow)
 try:
     import pyarrow as pa
@@ -21,151 +29,427 @@ try:
 except Exception:
     HAVE_PARQUET = False
 
+# Optional JIT for the categorical draws (numba)
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except Exception:
+    HAVE_NUMBA = False
+
+
+# Rows per generated chunk
+CHUNK_SIZE = 100_000
+
+FIELDNAMES = ["name", "family_name", "marital_status", "age", "number_of_children"]
 
 MARITAL_STATUSES = ["single", "married", "divorced", "widowed"]
+# Marital status travels through the pipeline as int8 codes into MARITAL_STATUSES
+# and is only turned back into labels when writing CSV
+MARITAL_LABELS = np.array(MARITAL_STATUSES, dtype=object)
 
-def choose_marital_status(rng: random.Random, age: int) -> str:
-    # Simple age-informed probabilities (tweak as needed)
-    if age < 22:
-        weights = [0.94, 0.04, 0.01, 0.01]
-    elif age < 30:
-        weights = [0.6, 0.35, 0.03, 0.02]
-    elif age < 45:
-        weights = [0.25, 0.65, 0.07, 0.03]
-    elif age < 65:
-        weights = [0.15, 0.7, 0.1, 0.05]
-    else:
-        weights = [0.1, 0.65, 0.1, 0.15]
-    return rng.choices(MARITAL_STATUSES, weights=weights, k=1)[0]
+# Simple age-informed probabilities (tweak as needed), one row per age bucket:
+# <22, 22-29, 30-44, 45-64, 65+
+MARITAL_AGE_EDGES = [22, 30, 45, 65]
+MARITAL_WEIGHTS = np.array([
+    [0.94, 0.04, 0.01, 0.01],
+    [0.6, 0.35, 0.03, 0.02],
+    [0.25, 0.65, 0.07, 0.03],
+    [0.15, 0.7, 0.1, 0.05],
+    [0.1, 0.65, 0.1, 0.15],
+])
+
+# Weights for number of children 0..5, indexed by [age bucket, marital status].
+# Age buckets: <22, 22-29, 30-39, 40-54, 55+
+CHILDREN_AGE_EDGES = [22, 30, 40, 55]
+_NO_CHILDREN = [1.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+_SINGLE = [0.85, 0.1, 0.04, 0.009, 0.0009, 0.0001]
+_DIVORCED = [0.45, 0.3, 0.18, 0.06, 0.01, 0.005]
+_WIDOWED = [0.4, 0.3, 0.2, 0.08, 0.015, 0.005]
+CHILDREN_WEIGHTS = np.array([
+    [_NO_CHILDREN, _NO_CHILDREN, _NO_CHILDREN, _NO_CHILDREN],
+    [_SINGLE, [0.5, 0.35, 0.12, 0.027, 0.0028, 0.0002], _DIVORCED, _WIDOWED],
+    [_SINGLE, [0.25, 0.35, 0.28, 0.1, 0.02, 0.005], _DIVORCED, _WIDOWED],
+    [_SINGLE, [0.2, 0.3, 0.3, 0.15, 0.04, 0.01], _DIVORCED, _WIDOWED],
+    [_SINGLE, [0.2, 0.3, 0.3, 0.15, 0.04, 0.01], _DIVORCED, _WIDOWED],
+])
+
+def _cdf_thresholds(weights: np.ndarray) -> np.ndarray:
+    # Cumulative weights scaled so each row ends at 1, with that final 1 dropped:
+    # a uniform u in [0, 1) picks category j when row[j - 1] <= u < row[j].
+    # Weights need not sum to 1, the scaling is done here once per table.
+    cdf = weights.cumsum(axis=1)
+    return np.ascontiguousarray(cdf[:, :-1] / cdf[:, -1:])
+
+# Built once at import. Children rows are flattened to
+# bucket * len(MARITAL_STATUSES) + marital status.
+MARITAL_CDF = _cdf_thresholds(MARITAL_WEIGHTS)
+CHILDREN_CDF = _cdf_thresholds(CHILDREN_WEIGHTS.reshape(-1, CHILDREN_WEIGHTS.shape[-1]))
+
+# Ages are whole years up to MAX_AGE, so bucketing is a table lookup by age
+# instead of a binary search over the edges for every row
+MAX_AGE = 90
+MARITAL_BUCKET_BY_AGE = np.digitize(np.arange(MAX_AGE + 1), MARITAL_AGE_EDGES)
+CHILDREN_ROW_BY_AGE = np.digitize(np.arange(MAX_AGE + 1), CHILDREN_AGE_EDGES) * len(MARITAL_STATUSES)
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def _draw_rows_numba(cdf, rows, u):
+        # Same comparisons as the NumPy path below, one row at a time and
+        # without materializing an (n, k) matrix
+        k = cdf.shape[1]
+        out = np.empty(len(rows), dtype=np.int64)
+        for i in range(len(rows)):
+            row = cdf[rows[i]]
+            x = u[i]
+            j = 0
+            while j < k and x >= row[j]:
+                j += 1
+            out[i] = j
+        return out
 
-def sample_age(rng: random.Random) -> int:
+def _draw_categorical(rng: np.random.Generator, cdf_table: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    # One inverse-CDF draw per entry of rows, each using cdf_table[row]
+    u = rng.random(len(rows))
+    if HAVE_NUMBA:
+        return _draw_rows_numba(cdf_table, rows, u)
+    return (u[:, None] >= cdf_table[rows]).sum(axis=1)
+
+def sample_ages(rng: np.random.Generator, n: int) -> np.ndarray:
     # Skew towards working-age adults. Triangular distribution works well.
     # min=18, mode=32, max=90
-    return int(rng.triangular(18, 90, 32))
-
-def sample_children(rng: random.Random, age: int, marital_status: str) -> int:
-    if age < 22:
-        return 0
-    # Base weights for number of children 0..5
-    # Adjusted by marital status and age
-    if marital_status == "single":
-        weights = [0.85, 0.1, 0.04, 0.009, 0.0009, 0.0001]
-    elif marital_status == "married":
-        if age < 30:
-            weights = [0.5, 0.35, 0.12, 0.027, 0.0028, 0.0002]
-        elif age < 40:
-            weights = [0.25, 0.35, 0.28, 0.1, 0.02, 0.005]
-        elif age < 55:
-            weights = [0.2, 0.3, 0.3, 0.15, 0.04, 0.01]
-        else:
-            weights = [0.2, 0.3, 0.3, 0.15, 0.04, 0.01]
-    elif marital_status == "divorced":
-        weights = [0.45, 0.3, 0.18, 0.06, 0.01, 0.005]
-    else:  # widowed
-        weights = [0.4, 0.3, 0.2, 0.08, 0.015, 0.005]
-    return rng.choices([0, 1, 2, 3, 4, 5], weights=weights, k=1)[0]
+    return rng.triangular(18, 32, MAX_AGE, size=n).astype(np.int16)
+
+def choose_marital_statuses(rng: np.random.Generator, ages: np.ndarray) -> np.ndarray:
+    # Returns int8 codes indexing MARITAL_STATUSES
+    return _draw_categorical(rng, MARITAL_CDF, MARITAL_BUCKET_BY_AGE[ages]).astype(np.int8)
+
+def sample_children(rng: np.random.Generator, ages: np.ndarray, marital_statuses: np.ndarray) -> np.ndarray:
+    rows = CHILDREN_ROW_BY_AGE[ages] + marital_statuses
+    return _draw_categorical(rng, CHILDREN_CDF, rows).astype(np.int8)
+
+def _make_faker(locale: str, seed: Optional[int]) -> Faker:
+    # Unweighted sampling skips Faker's per-call frequency lookup. Names come out
+    # uniformly from the locale's list instead of by real-world frequency.
+    # Only the person provider is loaded, it is all this script uses.
+    fake = Faker(locale=locale, providers=["faker.providers.person"], use_weighting=False)
+    if seed is not None:
+        fake.seed_instance(seed)
+    return fake
+
+def build_name_pools(locale: str, seed: Optional[int], size: int) -> Tuple[np.ndarray, np.ndarray]:
+    fake = _make_faker(locale, seed)
+    first_name, last_name = fake.first_name, fake.last_name
+    # Object arrays keep the Faker str objects as they are, so both encoders
+    # get them back without a per-row conversion from fixed-width unicode
+    first_pool = np.array([first_name() for _ in range(size)], dtype=object)
+    last_pool = np.array([last_name() for _ in range(size)], dtype=object)
+    return first_pool, last_pool
+
+# Per-process state set up by _init_worker: the name pools are pickled once per
+# worker instead of once per chunk, and the per-row Faker instance is built once
+# and reseeded per chunk. It has to live at module level so it survives fork.
+_worker_state = {}
+
+def _init_worker(locale: str, first_pool: Optional[np.ndarray], last_pool: Optional[np.ndarray]) -> None:
+    _worker_state["first_pool"] = first_pool
+    _worker_state["last_pool"] = last_pool
+    _worker_state["fake"] = _make_faker(locale, None) if first_pool is None else None
+
+def _generate_chunk(task: tuple):
+    # Runs in a worker process when workers > 1, so it takes one picklable tuple.
+    # seed is this chunk's SeedSequence, or None for an unseeded run.
+    n, seed, encode = task
+    first_pool, last_pool = _worker_state["first_pool"], _worker_state["last_pool"]
+    rng = np.random.default_rng(seed)
+
+    # Sample all the numeric columns in one vectorized pass
+    ages = sample_ages(rng, n)
+    marital_statuses = choose_marital_statuses(rng, ages)
+    children = sample_children(rng, ages, marital_statuses)
+
+    if first_pool is not None:
+        first_names = first_pool[rng.integers(0, len(first_pool), size=n)]
+        last_names = last_pool[rng.integers(0, len(last_pool), size=n)]
+    else:
+        # Per-row Faker calls, with the bound methods looked up once. Reseeding
+        # from the chunk's SeedSequence gives the same names in any worker.
+        fake = _worker_state["fake"]
+        if seed is not None:
+            fake.seed_instance(int(seed.generate_state(1)[0]))
+        first_name, last_name = fake.first_name, fake.last_name
+        first_names = np.array([first_name() for _ in range(n)], dtype=object)
+        last_names = np.array([last_name() for _ in range(n)], dtype=object)
+
+    columns = {
+        "name": first_names,
+        "family_name": last_names,
+        "marital_status": marital_statuses,
+        "age": ages,
+        "number_of_children": children,
+    }
+    return columns if encode is None else encode(columns)
+
+def _ordered_pool_map(fn: Callable, tasks: Iterable, workers: int, initializer: Callable, initargs: tuple) -> Iterator:
+    # Like executor.map, but only keeps a few chunks in flight so results
+    # don't pile up in memory when the writer is the slower side.
+    # Results are whole encoded chunks (CSV bytes, or a RecordBatch, which
+    # pyarrow pickles as its raw column buffers), so nothing is pickled per row.
+    # Results stay in chunk order (no imap_unordered), so the output is the same
+    # for any number of workers.
+    with ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=initargs) as executor:
+        pending = collections.deque()
+        for task in tasks:
+            pending.append(executor.submit(fn, task))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 def generate_people(
     n: int,
     locale: str,
     seed: Optional[int],
-    with_progress: bool = True
-) -> Iterator[Dict[str, object]]:
-    rng = random.Random(seed)
-    fake = Faker(locale=locale)
-    if seed is not None:
-        Faker.seed(seed)
-
-    for i in range(n):
-        age = sample_age(rng)
-        marital_status = choose_marital_status(rng, age)
-        children = sample_children(rng, age, marital_status)
-        person = {
-            "name": fake.first_name(),
-            "family_name": fake.last_name(),
-            "marital_status": marital_status,
-            "age": age,
-            "number_of_children": children,
-        }
-        if with_progress and (i + 1) % 100000 == 0:
-            print(f"Generated {i+1}/{n} rows...", file=sys.stderr)
-        yield person
-
-def write_csv(path: str, rows: Iterator[Dict[str, object]]) -> None:
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f,
-            fieldnames=["name", "family_name", "marital_status", "age", "number_of_children"]
+    name_pool_size: int = 10_000,
+    chunk_size: int = CHUNK_SIZE,
+    workers: int = 1,
+    encode: Optional[Callable] = None,
+) -> Iterator:
+    """Generate n fake people in chunks of chunk_size rows.
+
+    Each chunk is a dict of NumPy columns keyed by FIELDNAMES, or encode(chunk)
+    when an encoder is given. marital_status holds int8 codes into
+    MARITAL_STATUSES, the encoders decode (CSV) or dictionary-encode (Parquet)
+    them. Chunk i draws from the i-th child of SeedSequence(seed), so nearby
+    seeds give unrelated data, and the output depends on seed and chunk_size
+    but not on workers. With workers > 1 the chunks are generated
+    and encoded in a process pool and yielded in order.
+
+    Names are drawn from a pool of name_pool_size Faker names sampled once up
+    front, so a run makes 2 * name_pool_size Faker calls instead of 2 * n. The
+    price is that at most name_pool_size distinct first (and last) names show up
+    in the output, which is plenty for synthetic data but not for uniqueness
+    tests. Pass name_pool_size=0 to call Faker for every row.
+    """
+    first_pool, last_pool = None, None
+    if name_pool_size > 0:
+        first_pool, last_pool = build_name_pools(locale, seed, name_pool_size)
+
+    # SeedSequence(seed, spawn_key=(i,)) is the i-th child SeedSequence(seed).spawn()
+    # would return, built directly so the number of chunks needn't be known up front
+    tasks = (
+        (
+            min(chunk_size, n - start),
+            None if seed is None else np.random.SeedSequence(seed, spawn_key=(i,)),
+            encode,
         )
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        for i, start in enumerate(range(0, n, chunk_size))
+    )
+    initargs = (locale, first_pool, last_pool)
+    if workers > 1:
+        yield from _ordered_pool_map(_generate_chunk, tasks, workers, _init_worker, initargs)
+    else:
+        _init_worker(*initargs)
+        yield from map(_generate_chunk, tasks)
 
-def write_parquet(path: str, rows: Iterator[Dict[str, object]], chunk_size: int = 100_000) -> None:
-    if not HAVE_PARQUET:
-        print("Parquet support requires pyarrow. Install with: pip install pyarrow", file=sys.stderr)
-        sys.exit(1)
+def _report_progress(chunks: Iterable, n: int, chunk_size: int) -> Iterator:
+    # Prints once per chunk, never per row. A chunk handed on here may still be
+    # queued for the writer thread (or buffered into a Parquet row group), so
+    # this counts generated rows, not rows on disk.
+    for i, chunk in enumerate(chunks):
+        yield chunk
+        print(f"Generated {min((i + 1) * chunk_size, n)}/{n} rows...", file=sys.stderr)
+
+def _write_behind(write: Callable, chunks: Iterable, depth: int = 2) -> None:
+    # Calls write(chunk) on a writer thread, at most depth chunks behind, so the
+    # next chunk is generated while the previous one is written. File writes and
+    # Parquet encoding/compression release the GIL, so the two really overlap.
+    pending = Queue(maxsize=depth)
+    errors = []
+
+    def run():
+        # Keeps draining after a failed write so the producer never blocks on put
+        for chunk in iter(pending.get, None):
+            if not errors:
+                try:
+                    write(chunk)
+                except BaseException as e:
+                    errors.append(e)
+
+    writer = threading.Thread(target=run, name="writer", daemon=True)
+    writer.start()
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            pending.put(chunk)
+    finally:
+        pending.put(None)
+        writer.join()
+    if errors:
+        raise errors[0]
+
+# Characters that make the csv module quote a field
+CSV_SPECIAL_CHARS = ',"\r\n'
+CSV_HEADER = (",".join(FIELDNAMES) + "\r\n").encode("utf-8")
+
+def _needs_quoting(values: List[str]) -> bool:
+    text = "".join(values)
+    return any(c in text for c in CSV_SPECIAL_CHARS)
 
-    schema = pa.schema([
+def _csv_field(value: str) -> str:
+    # Quotes a field the way csv.writer's default QUOTE_MINIMAL does
+    if any(c in value for c in CSV_SPECIAL_CHARS):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+def encode_csv_chunk(columns: Dict[str, np.ndarray]) -> bytes:
+    # Only the name columns can need quoting, the rest are labels and integers.
+    # The whole column is checked at once and escaped only if something in it needs it.
+    names = columns["name"].tolist()
+    family_names = columns["family_name"].tolist()
+    if _needs_quoting(names):
+        names = [_csv_field(name) for name in names]
+    if _needs_quoting(family_names):
+        family_names = [_csv_field(name) for name in family_names]
+    rows = zip(
+        names,
+        family_names,
+        MARITAL_LABELS.take(columns["marital_status"]).tolist(),
+        columns["age"].tolist(),
+        columns["number_of_children"].tolist(),
+    )
+    # Same "\r\n" line terminator as csv.writer, so the output matches what it would write
+    line = "%s,%s,%s,%d,%d\r\n"
+    return "".join([line % row for row in rows]).encode("utf-8")
+
+def write_csv(path: str, chunks: Iterable[bytes]) -> None:
+    # Chunks are ~2-3 MB each, a 16 MiB buffer batches several per write()
+    with open(path, "wb", buffering=16 << 20) as f:
+        f.write(CSV_HEADER)
+        _write_behind(f.write, chunks)
+
+# Default rows per Parquet row group (--row-group-size)
+PARQUET_ROW_GROUP_SIZE = 1_000_000
+
+# --compression choices as (codec, level). zstd level 1 compresses this data
+# about as well as level 3 and is noticeably faster to write.
+PARQUET_COMPRESSION = {
+    "zstd1": ("zstd", 1),
+    "zstd3": ("zstd", 3),
+    "snappy": ("snappy", None),
+    "none": ("none", None),
+}
+
+if HAVE_PARQUET:
+    PARQUET_SCHEMA = pa.schema([
         ("name", pa.string()),
         ("family_name", pa.string()),
-        ("marital_status", pa.string()),
+        ("marital_status", pa.dictionary(pa.int8(), pa.string())),
         ("age", pa.int16()),
         ("number_of_children", pa.int8()),
     ])
+    MARITAL_DICTIONARY = pa.array(MARITAL_STATUSES, type=pa.string())
 
-    writer = None
-    try:
-        batch: Dict[str, List] = {
-            "name": [],
-            "family_name": [],
-            "marital_status": [],
-            "age": [],
-            "number_of_children": [],
-        }
-        count = 0
-        for row in rows:
-            for k in batch:
-                batch[k].append(row[k])
-            count += 1
-
-            if count % chunk_size == 0:
-                table = pa.Table.from_pydict(batch, schema=schema)
-                if writer is None:
-                    writer = pq.ParquetWriter(path, table.schema, compression="zstd")
-                writer.write_table(table)
-                for k in batch:
-                    batch[k].clear()
-
-        if batch["name"]:
-            table = pa.Table.from_pydict(batch, schema=schema)
-            if writer is None:
-                writer = pq.ParquetWriter(path, table.schema, compression="zstd")
-            writer.write_table(table)
-    finally:
-        if writer is not None:
-            writer.close()
+def encode_parquet_chunk(columns: Dict[str, np.ndarray]) -> "pa.RecordBatch":
+    # Numeric columns are wrapped without copying, marital_status reuses its codes
+    return pa.RecordBatch.from_arrays([
+        pa.array(columns["name"], type=pa.string()),
+        pa.array(columns["family_name"], type=pa.string()),
+        pa.DictionaryArray.from_arrays(columns["marital_status"], MARITAL_DICTIONARY),
+        pa.array(columns["age"], type=pa.int16()),
+        pa.array(columns["number_of_children"], type=pa.int8()),
+    ], schema=PARQUET_SCHEMA)
+
+def _rechunk(batches: Iterable["pa.RecordBatch"], rows: int) -> Iterator["pa.Table"]:
+    # Buffers the CHUNK_SIZE batches into tables of exactly rows rows (only the
+    # last one may be shorter), so each becomes one full row group instead of
+    # every chunk (or a small -n) producing its own tiny one. Slices don't copy.
+    pending, pending_rows = [], 0
+    for batch in batches:
+        pending.append(batch)
+        pending_rows += batch.num_rows
+        if pending_rows >= rows:
+            table = pa.Table.from_batches(pending)
+            full = pending_rows - pending_rows % rows
+            yield table.slice(0, full)
+            pending = table.slice(full).to_batches()
+            pending_rows -= full
+    if pending_rows:
+        yield pa.Table.from_batches(pending)
+
+def write_parquet(
+    path: str,
+    batches: Iterable["pa.RecordBatch"],
+    compression: str = "zstd1",
+    row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+) -> None:
+    if not HAVE_PARQUET:
+        print("Parquet support requires pyarrow. Install with: pip install pyarrow", file=sys.stderr)
+        sys.exit(1)
+
+    codec, level = PARQUET_COMPRESSION[compression]
+    # 1 MiB data and dictionary pages mean fewer page headers, and skipping
+    # column statistics saves computing min/max for every page. Readers lose
+    # min/max-based row group pruning, which this generated data doesn't need.
+    with pq.ParquetWriter(
+        path,
+        PARQUET_SCHEMA,
+        compression=codec,
+        compression_level=level,
+        use_dictionary=True,
+        data_page_size=1 << 20,
+        dictionary_pagesize_limit=1 << 20,
+        write_statistics=False,
+    ) as writer:
+        tables = _rechunk(batches, row_group_size)
+        _write_behind(lambda table: writer.write_table(table, row_group_size=row_group_size), tables)
+
+def _int_at_least(minimum: int) -> Callable[[str], int]:
+    # argparse type for integer flags with a lower bound
+    def integer(text: str) -> int:
+        value = int(text)
+        if value < minimum:
+            raise argparse.ArgumentTypeError(f"must be at least {minimum}, got {value}")
+        return value
+    return integer
 
 def main():
     parser = argparse.ArgumentParser(description="Generate fake people data.")
-    parser.add_argument("-n", "--num", type=int, default=1_000_000, help="Number of records to generate")
+    parser.add_argument("-n", "--num", type=_int_at_least(0), default=1_000_000, help="Number of records to generate")
     parser.add_argument("-o", "--out", type=str, default="people.csv", help="Output file path")
     parser.add_argument("-f", "--format", choices=["csv", "parquet"], default="csv", help="Output format")
     parser.add_argument("-l", "--locale", type=str, default="en_US", help="Faker locale (e.g., en_US, fr_FR, he_IL)")
-    parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducibility")
+    parser.add_argument("--seed", type=_int_at_least(0), default=42, help="Random seed for reproducibility")
     parser.add_argument("--no-progress", action="store_true", help="Disable progress messages")
+    parser.add_argument("--name-pool-size", type=_int_at_least(0), default=10_000,
+                        help="Number of Faker names to sample once and reuse (0 calls Faker for every row)")
+    parser.add_argument("-w", "--workers", type=_int_at_least(1), default=1,
+                        help="Worker processes generating chunks in parallel (output does not depend on it)")
+    parser.add_argument("--compression", choices=list(PARQUET_COMPRESSION), default="zstd1",
+                        help="Parquet compression codec and level")
+    parser.add_argument("--row-group-size", type=_int_at_least(1), default=PARQUET_ROW_GROUP_SIZE,
+                        help="Rows per Parquet row group")
     args = parser.parse_args()
 
-    rows_iter = generate_people(args.num, args.locale, args.seed, with_progress=not args.no_progress)
+    chunks = generate_people(
+        args.num,
+        args.locale,
+        args.seed,
+        name_pool_size=args.name_pool_size,
+        workers=args.workers,
+        encode=encode_csv_chunk if args.format == "csv" else encode_parquet_chunk,
+    )
+    if not args.no_progress:
+        chunks = _report_progress(chunks, args.num, CHUNK_SIZE)
 
     os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
 
     if args.format == "csv":
-        write_csv(args.out, rows_iter)
+        write_csv(args.out, chunks)
     else:
-        write_parquet(args.out, rows_iter)
+        write_parquet(args.out, chunks, compression=args.compression, row_group_size=args.row_group_size)
 
     print(f"Done. Wrote {args.num} rows to {args.out}", file=sys.stderr)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
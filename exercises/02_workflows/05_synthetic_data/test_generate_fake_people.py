@@ -0,0 +1,29 @@
+# Checks for generate_fake_people.py, run with: pytest test_generate_fake_people.py
+import numpy as np
+from generate_fake_people import generate_people
+
+CHUNK_SIZE = 1_000
+NUMERIC_COLUMNS = ["marital_status", "age", "number_of_children"]
+
+def _chunks(seed, workers=1):
+    return list(generate_people(3 * CHUNK_SIZE, "en_US", seed, name_pool_size=100,
+                                chunk_size=CHUNK_SIZE, workers=workers))
+
+def _same_chunk(a, b):
+    return all(np.array_equal(a[column], b[column]) for column in NUMERIC_COLUMNS)
+
+def test_same_seed_reproduces_output():
+    for a, b in zip(_chunks(42), _chunks(42)):
+        assert _same_chunk(a, b)
+        assert np.array_equal(a["name"], b["name"])
+
+def test_nearby_seeds_share_no_chunk():
+    chunks_42, chunks_43 = _chunks(42), _chunks(43)
+    for a in chunks_42:
+        for b in chunks_43:
+            assert not _same_chunk(a, b)
+
+def test_output_does_not_depend_on_workers():
+    for a, b in zip(_chunks(42), _chunks(42, workers=2)):
+        assert _same_chunk(a, b)
+        assert np.array_equal(a["family_name"], b["family_name"])
@@ -1,44 +1,142 @@
-# Implement Product and ShoppingCart classes to pass the tests
+# Product and ShoppingCart classes that pass tests/test_shopping_cart.py
+# All money math is done in integer cents, floats only appear at the API boundary
+from collections import Counter
+from dataclasses import dataclass
+from decimal import Decimal
+from fractions import Fraction
+
 
 class Product:
+    # Products compare by value and are used as dict keys, so they are immutable:
+    # changing one inside a cart would break its hash and the cart's running totals
+    __slots__ = ("name", "price_cents", "_hash")
+
     def __init__(self, name: str, price: float):
-        # Implement
-        pass
+        price_cents = round(price * 100)
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "price_cents", price_cents)
+        object.__setattr__(self, "_hash", hash((name, price_cents)))
+
+    def __setattr__(self, attr, value):
+        raise AttributeError(f"Product is immutable, cannot set {attr!r}")
+
+    def __delattr__(self, attr):
+        raise AttributeError(f"Product is immutable, cannot delete {attr!r}")
+
+    def __reduce__(self):
+        # copy/pickle rebuild through __init__, which also recomputes _hash
+        # (str hashes differ between processes)
+        return (Product, (self.name, self.price_cents / 100))
+
+    def __eq__(self, other):
+        if not isinstance(other, Product):
+            return NotImplemented
+        return self.name == other.name and self.price_cents == other.price_cents
+
+    def __hash__(self):
+        return self._hash
+
+
+@dataclass(slots=True)
+class CartLine:
+    product: Product
+    quantity: int
 
 
 class ShoppingCart:
-    def __init__(self):
-        # Implement
-        pass
+    def __init__(self, exact: bool = False):
+        # exact=True returns Decimal amounts (always 2 places) instead of float
+        self.exact = exact
+        # Quantities keyed by product, equal products share one line
+        self._quantities = Counter()
+        # Running totals, updated on add/remove so reads are O(1)
+        self._item_count = 0
+        self._raw_subtotal_cents = 0
+        self._discount_percentage = None
+        self._discount_cents = None
+        self._tax_rate = Fraction(0)
+        self._specialize()
+
+    def _money(self, cents: int):
+        if self.exact:
+            return (Decimal(cents) / 100).quantize(Decimal("0.01"))
+        return cents / 100
+
+    def _specialize(self):
+        # Discount and tax change rarely, so instead of branching on every read
+        # build closures with the current settings baked in. They are rebuilt
+        # by apply_discount/set_tax_rate and take the running subtotal as input.
+        # Rates are exact fractions, so each amount is rounded once, half-up,
+        # in integer math: round(cents * num / den) == (2 * cents * num + den) // (2 * den)
+        tax_num, tax_den = self._tax_rate.numerator, self._tax_rate.denominator
+        if self._discount_percentage is not None:
+            discount_num = self._discount_percentage.numerator
+            discount_den = self._discount_percentage.denominator * 100
+
+            def subtotal_fn(cents):
+                discount = (2 * cents * discount_num + discount_den) // (2 * discount_den)
+                return max(cents - discount, 0)
+        elif self._discount_cents is not None:
+            discount_cents = self._discount_cents
+
+            def subtotal_fn(cents):
+                return max(cents - discount_cents, 0)
+        else:
+            def subtotal_fn(cents):
+                return cents
+
+        def total_fn(cents):
+            discounted = subtotal_fn(cents)
+            return discounted + (2 * discounted * tax_num + tax_den) // (2 * tax_den)
+
+        self._subtotal_fn = subtotal_fn
+        self._total_fn = total_fn
+
+    def lines(self):
+        for product, quantity in self._quantities.items():
+            yield CartLine(product, quantity)
 
     def item_count(self) -> int:
-        # Implement
-        pass
+        return self._item_count
 
     def total(self) -> float:
-        # Implement
-        pass
+        return self._money(self._total_fn(self._raw_subtotal_cents))
 
     def add_item(self, product: Product, quantity: int):
-        # Implement
-        pass
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive")
+        self._quantities[product] += quantity
+        self._item_count += quantity
+        self._raw_subtotal_cents += product.price_cents * quantity
 
     def remove_item(self, product: Product, quantity: int):
-        # Implement
-        pass
+        if quantity <= 0:
+            raise ValueError("Quantity must be positive")
+        if product not in self._quantities:
+            raise ValueError("Product not in cart")
+        if quantity > self._quantities[product]:
+            raise ValueError("Not enough quantity")
+        self._quantities[product] -= quantity
+        if self._quantities[product] == 0:
+            del self._quantities[product]
+        self._item_count -= quantity
+        self._raw_subtotal_cents -= product.price_cents * quantity
 
     def apply_discount(self, percentage: float = None, amount: float = None):
-        # Implement
-        pass
+        # Only one discount at a time, a new one replaces the old one.
+        # Going through str() keeps the rate as written (65.6 is exactly 656/10).
+        self._discount_percentage = None if percentage is None else Fraction(str(percentage))
+        self._discount_cents = None if amount is None else round(amount * 100)
+        self._specialize()
 
     def set_tax_rate(self, rate: float):
-        # Implement
-        pass
+        self._tax_rate = Fraction(str(rate))
+        self._specialize()
 
     def subtotal(self) -> float:
-        # Implement
-        pass
+        # Subtotal after discount, before tax
+        return self._money(self._subtotal_fn(self._raw_subtotal_cents))
 
     def tax(self) -> float:
-        # Implement
-        pass
+        cents = self._raw_subtotal_cents
+        return self._money(self._total_fn(cents) - self._subtotal_fn(cents))
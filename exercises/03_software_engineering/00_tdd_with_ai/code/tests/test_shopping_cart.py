@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 import pytest
 from src.shopping_cart import ShoppingCart, Product
 
@@ -35,6 +37,24 @@ class TestShoppingCart:
         assert self.cart.item_count() == 3
         assert self.cart.total() == 30.00
 
+    def test_product_is_immutable(self):
+        """Products can't be changed once they may be in a cart."""
+        self.cart.add_item(self.product1, quantity=1)
+
+        with pytest.raises(AttributeError):
+            self.product1.price_cents = 3
+        with pytest.raises(AttributeError):
+            self.product1.name = "Gadget"
+        assert self.cart.total() == 10.00
+
+    def test_equal_products_share_a_line(self):
+        """Products with the same name and price are the same cart item."""
+        self.cart.add_item(self.product1, quantity=1)
+        self.cart.add_item(Product("Widget", 10.00), quantity=2)
+
+        assert self.cart.item_count() == 3
+        assert len(list(self.cart.lines())) == 1
+
     def test_remove_item_completely(self):
         """Removing all quantity of an item should remove it from cart."""
         self.cart.add_item(self.product1, quantity=2)
@@ -63,6 +83,25 @@ class TestShoppingCart:
         with pytest.raises(ValueError, match="Not enough quantity"):
             self.cart.remove_item(self.product1, quantity=3)
 
+    def test_add_non_positive_quantity_raises_error(self):
+        """Adding a zero or negative quantity should raise error."""
+        for quantity in (0, -3):
+            with pytest.raises(ValueError, match="Quantity must be positive"):
+                self.cart.add_item(self.product1, quantity=quantity)
+        assert self.cart.item_count() == 0
+        assert self.cart.total() == 0
+        assert list(self.cart.lines()) == []
+
+    def test_remove_non_positive_quantity_raises_error(self):
+        """Removing a zero or negative quantity should raise error."""
+        self.cart.add_item(self.product1, quantity=1)
+
+        for quantity in (0, -4):
+            with pytest.raises(ValueError, match="Quantity must be positive"):
+                self.cart.remove_item(self.product1, quantity=quantity)
+        assert self.cart.item_count() == 1
+        assert self.cart.total() == 10.0
+
     def test_apply_percentage_discount(self):
         """Apply percentage discount to total."""
         self.cart.add_item(self.product1, quantity=2)  # $20
@@ -111,4 +150,44 @@ class TestShoppingCart:
         assert self.cart.tax() == 1.44
         assert self.cart.total() == 19.44
 
+    def test_tax_rate_finer_than_basis_points(self):
+        """Tax rates are not truncated to whole basis points."""
+        self.cart.add_item(Product("Laptop", 1000.00), quantity=1)
+        self.cart.set_tax_rate(0.08875)  # 8.875% tax
+
+        assert self.cart.tax() == 88.75
+        assert self.cart.total() == 1088.75
+
+    def test_percentage_discount_is_exact(self):
+        """Percentage discounts don't lose a cent to float products."""
+        self.cart.add_item(Product("Pen", 3.75), quantity=1)
+        self.cart.apply_discount(percentage=65.6)  # 246 cents off
+
+        assert self.cart.total() == 1.29
+
+    def test_items_added_after_discount_and_tax_are_priced(self):
+        """Discount and tax settings should apply to items added later."""
+        self.cart.apply_discount(percentage=10)
+        self.cart.set_tax_rate(0.08)
+        self.cart.add_item(self.product1, quantity=2)  # $20 -> $18
+
+        assert self.cart.subtotal() == 18.00
+        assert self.cart.total() == 19.44
+
+    def test_prices_do_not_accumulate_float_error(self):
+        """Cart math should be exact in cents (no 0.1 + 0.2 artifacts)."""
+        self.cart.add_item(Product("Dime", 0.10), quantity=1)
+        self.cart.add_item(Product("Coin", 0.20), quantity=1)
+
+        assert self.cart.total() == 0.30
+
+    def test_exact_cart_returns_decimal(self):
+        """An exact cart should report amounts as 2-place Decimals."""
+        cart = ShoppingCart(exact=True)
+        cart.add_item(self.product1, quantity=2)  # $20
+        cart.set_tax_rate(0.08)
+
+        assert cart.total() == Decimal("21.60")
+        assert str(cart.tax()) == "1.60"
+
 # Implement Product and ShoppingCart to make tests pass
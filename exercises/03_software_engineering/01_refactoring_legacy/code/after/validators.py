@@ -1,7 +1,13 @@
 # validators.py
+import re
+
+# Compiled once at import, not on every validate_email call
+EMAIL_PATTERN = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+
 class UserValidator:
     def validate_email(self, email: str) -> None:
-        if not '@' in email:
+        if not EMAIL_PATTERN.fullmatch(email):
             raise ValueError("Invalid email")
 
     def validate_password(self, password: str) -> None:
@@ -1,16 +1,15 @@
 import threading
-import time
 
 balance = 0
 lock = threading.Lock()
 
 def deposit_fixed(amount):
     global balance
+    # Hold the lock only for the read-modify-write itself
     with lock:
-        current = balance
-        time.sleep(0.001)
-        balance = current + amount
-        print(f"Deposited {amount}, balance now {balance}")
+        balance += amount
+        new_balance = balance
+    print(f"Deposited {amount}, balance now {new_balance}")
 
 # Test to verify fix
 def test_race_condition_fixed():
@@ -30,4 +29,31 @@ def test_race_condition_fixed():
     print(f"Expected: 100, Got: {balance}")
     # Should always be 100
 
+# No lock at all: each thread deposits into its own slot and the
+# slots are summed once every thread has joined
+def deposit_local(totals, index, amount, times):
+    subtotal = 0
+    for _ in range(times):
+        subtotal += amount
+    totals[index] = subtotal
+
+def test_thread_local_totals():
+    num_threads = 10
+    totals = [0] * num_threads
+
+    threads = []
+    for i in range(num_threads):
+        t = threading.Thread(target=deposit_local, args=(totals, i, 10, 1000))
+        threads.append(t)
+        t.start()
+
+    for t in threads:
+        t.join()
+
+    final_balance = sum(totals)
+    print(f"Final balance: {final_balance}")
+    print(f"Expected: 100000, Got: {final_balance}")
+    # Should always be 100000
+
 test_race_condition_fixed()
+test_thread_local_totals()
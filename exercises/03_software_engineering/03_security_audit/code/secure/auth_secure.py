@@ -0,0 +1,109 @@
+from flask import Flask, request, session
+import hashlib
+import hmac
+import secrets
+import sqlite3
+import threading
+
+app = Flask(__name__)
+# Random secret key instead of a hard-coded one
+app.secret_key = secrets.token_hex(32)
+
+# scrypt cost parameters (memory-hard, ~16 MiB per hash)
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+SALT_BYTES = 16
+
+# Own database file: the other demos keep a differently shaped users table in app.db
+DB_PATH = 'auth_secure.db'
+
+# One connection for the app instead of a connect per request. sqlite keeps
+# its compiled statements per connection, so repeated queries are prepared once.
+# Requests may run on several threads, so every use goes through _db_lock.
+_db = sqlite3.connect(DB_PATH, check_same_thread=False)
+_db.execute("PRAGMA journal_mode=WAL")
+_db_lock = threading.Lock()
+
+def init_db():
+    """Create the users table if it doesn't exist."""
+    with _db_lock:
+        _db.execute(
+            """CREATE TABLE IF NOT EXISTS users (
+                   id INTEGER PRIMARY KEY,
+                   username TEXT NOT NULL,
+                   password_salt BLOB NOT NULL,
+                   password_hash BLOB NOT NULL,
+                   is_admin INTEGER NOT NULL DEFAULT 0
+               )"""
+        )
+        # Logins look users up by name: the index makes that a B-tree search
+        # instead of a table scan, and rejects duplicate usernames
+        _db.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_users_username ON users(username)")
+        _db.commit()
+
+def hash_password(password: str, salt: bytes) -> bytes:
+    """Hash password with scrypt and a per-user salt."""
+    return hashlib.scrypt(password.encode(), salt=salt, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P)
+
+def verify_password(password: str, salt: bytes, password_hash: bytes) -> bool:
+    """Verify password against its stored hash (constant time)."""
+    return hmac.compare_digest(hash_password(password, salt), password_hash)
+
+def create_user(username: str, password: str, is_admin: bool = False):
+    """Store a new user with a fresh random salt."""
+    salt = secrets.token_bytes(SALT_BYTES)
+    password_hash = hash_password(password, salt)
+    with _db_lock:
+        _db.execute(
+            "INSERT INTO users (username, password_salt, password_hash, is_admin) VALUES (?, ?, ?, ?)",
+            (username, salt, password_hash, int(is_admin))
+        )
+        _db.commit()
+
+init_db()
+
+# Checked against when the username doesn't exist, so unknown users cost
+# the same scrypt call and response times don't reveal valid usernames
+_DUMMY_SALT = secrets.token_bytes(SALT_BYTES)
+_DUMMY_HASH = hash_password(secrets.token_hex(16), _DUMMY_SALT)
+
+@app.route('/login', methods=['POST'])
+def login():
+    username = request.form['username']
+    password = request.form['password']
+
+    # Look the user up by name only, the salt is needed before hashing.
+    # The lock is released before the (slow) scrypt check.
+    with _db_lock:
+        user = _db.execute(
+            "SELECT id, password_salt, password_hash FROM users WHERE username = ?",
+            (username,)
+        ).fetchone()
+
+    if user is None:
+        verify_password(password, _DUMMY_SALT, _DUMMY_HASH)
+        return "Login failed", 401
+
+    user_id, salt, password_hash = user
+    if not verify_password(password, salt, password_hash):
+        return "Login failed", 401
+
+    # Start a fresh session (prevents session fixation)
+    session.clear()
+    session['user_id'] = user_id
+    return "Logged in"
+
+@app.route('/admin')
+def admin():
+    user_id = session.get('user_id')
+    if user_id is None:
+        return "Forbidden", 403
+
+    # Admin rights come from the database, not from session data
+    with _db_lock:
+        user = _db.execute("SELECT is_admin FROM users WHERE id = ?", (user_id,)).fetchone()
+
+    if user and user[0]:
+        return "Admin panel"
+    return "Forbidden", 403
@@ -0,0 +1,33 @@
+# tests/conftest.py
+import pytest
+from app import app
+
+# Overrides applied for the whole test session. The test client talks plain
+# HTTP, so Secure-only session cookies are turned off here: a test that checks
+# cookie flags must set SESSION_COOKIE_SECURE itself. CSRF tokens are not checked.
+TEST_CONFIG = {
+    'TESTING': True,
+    'SECRET_KEY': 'test',
+    'SESSION_COOKIE_SECURE': False,
+    'WTF_CSRF_ENABLED': False,
+}
+
+_MISSING = object()
+
+@pytest.fixture(scope="session")
+def test_app():
+    """The app with TEST_CONFIG applied, restored after the session."""
+    saved = {key: app.config.get(key, _MISSING) for key in TEST_CONFIG}
+    app.config.update(TEST_CONFIG)
+    yield app
+    for key, value in saved.items():
+        if value is _MISSING:
+            app.config.pop(key, None)
+        else:
+            app.config[key] = value
+
+@pytest.fixture(scope="session")
+def client(test_app):
+    """One test client shared by the whole test session."""
+    with test_app.test_client() as c:
+        yield c
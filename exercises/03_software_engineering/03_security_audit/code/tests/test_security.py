@@ -1,63 +1,55 @@
 # tests/test_security.py
 import pytest
-from app import app
 
-class TestSecurityHeaders:
-    """Test security headers are present."""
+# Security headers
 
-    def test_csp_header(self):
-        """Test Content-Security-Policy header."""
-        with app.test_client() as client:
-            response = client.get('/')
-            assert 'Content-Security-Policy' in response.headers
+def test_csp_header(client):
+    """Test Content-Security-Policy header."""
+    response = client.get('/')
+    assert 'Content-Security-Policy' in response.headers
 
-    def test_xss_protection_header(self):
-        """Test X-XSS-Protection header."""
-        with app.test_client() as client:
-            response = client.get('/')
-            assert response.headers.get('X-XSS-Protection') == '1; mode=block'
+def test_xss_protection_header(client):
+    """Test X-XSS-Protection header."""
+    response = client.get('/')
+    assert response.headers.get('X-XSS-Protection') == '1; mode=block'
 
-    def test_clickjacking_protection(self):
-        """Test X-Frame-Options header."""
-        with app.test_client() as client:
-            response = client.get('/')
-            assert response.headers.get('X-Frame-Options') == 'DENY'
+def test_clickjacking_protection(client):
+    """Test X-Frame-Options header."""
+    response = client.get('/')
+    assert response.headers.get('X-Frame-Options') == 'DENY'
 
 class TestInputValidation:
     """Test input validation."""
 
-    def test_sql_injection_prevention(self):
+    def test_sql_injection_prevention(self, client):
         """Test SQL injection is prevented."""
-        with app.test_client() as client:
-            # Try SQL injection
-            response = client.get('/user?id=1 OR 1=1')
-            assert response.status_code == 400
+        # Try SQL injection
+        response = client.get('/user?id=1 OR 1=1')
+        assert response.status_code == 400
 
-    def test_xss_prevention(self):
+    def test_xss_prevention(self, client):
         """Test XSS is prevented."""
-        with app.test_client() as client:
-            response = client.get('/search?query=<script>alert(1)</script>')
-            # Check that script is escaped
-            assert b'<script>' not in response.data
+        response = client.get('/search?query=<script>alert(1)</script>')
+        # Check that script is escaped
+        assert b'<script>' not in response.data
 
 class TestAuthentication:
     """Test authentication security."""
 
-    def test_rate_limiting(self):
+    # Failed login body, encoded once instead of on every post
+    WRONG_LOGIN = b'{"username": "test", "password": "wrong"}'
+
+    def test_rate_limiting(self, test_app):
         """Test login rate limiting."""
-        with app.test_client() as client:
+        # Own client rather than the shared one, so the failed logins here
+        # don't leave cookies or session state behind for other tests
+        with test_app.test_client() as client:
             # Try multiple failed logins
             for i in range(15):
-                client.post('/login', json={
-                    'username': 'test',
-                    'password': 'wrong'
-                })
+                client.post('/login', data=self.WRONG_LOGIN, content_type='application/json')
 
             # Next attempt should be rate limited
-            response = client.post('/login', json={
-                'username': 'test',
-                'password': 'wrong'
-            })
+            response = client.post('/login', data=self.WRONG_LOGIN, content_type='application/json')
             assert response.status_code == 429
 
     def test_session_timeout(self):